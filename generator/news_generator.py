@@ -4,14 +4,21 @@ import os
 import re
 import sys
 import json
-import zipfile
+import mmap
+import queue
 import shutil
+import stat
 import unicodedata
-import subprocess
+import threading
+import time
 import traceback
-from datetime import datetime
+from datetime import datetime, timezone, tzinfo
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Dict, Any, List, Tuple
+from typing import TYPE_CHECKING, Optional, Dict, Any, List, Set, Tuple
+
+if TYPE_CHECKING:
+    import zipfile  # imported lazily where ZIPs are written
 
 try:
     import tkinter as tk
@@ -28,28 +35,107 @@ OUTPUT_ROOT = Path(__file__).parent / "output"
 SETTINGS_FILE = Path(__file__).parent / "settings_advanced.json"
 MAX_IMAGE_SIZE_MB = 10  # Maximum image size in MB
 SUPPORTED_IMAGE_FORMATS = {'.jpg', '.jpeg', '.png', '.gif', '.webp', '.svg'}
-
-
+SLUG_DEBOUNCE_MS = 150  # Idle time after the last title keystroke before the slug updates
+PROGRESS_INTERVAL = 0.05  # Minimum seconds between progress label redraws
+CLOCK_CACHE_SECONDS = 0.5  # today_date_str/now_iso_local share one clock read within this window
+TZ_RECHECK_SECONDS = 900  # DST switches fall on quarter-hour boundaries, so re-resolve the offset per slot
+MAX_COPY_WORKERS = 8  # Parallel image copies per draft
+COPY_BUFSIZE = 1024 * 1024  # 1 MiB buffer for streaming images into ZIPs
+# Already-compressed formats are stored in ZIPs as-is; deflating them gains nothing
+PRECOMPRESSED_IMAGE_FORMATS = {'.jpg', '.jpeg', '.png', '.gif', '.webp'}
+
+SLUG_INVALID_RE = re.compile(r"[^a-z0-9]+")
+SLUG_RE = re.compile(r"^[a-z0-9]+(?:-[a-z0-9]+)*$")
+DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+YAML_SPECIAL_CHARS = frozenset('":>#[],{}|\n')
+YAML_SAFE_CHARS = frozenset("abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789 _-./")
+# Path separators and other dangerous characters become "_", control characters are dropped
+FILENAME_TABLE = {ord(ch): '_' for ch in '<>:"/\\|?*'}
+FILENAME_TABLE.update({code: None for code in range(32)})
+
+
+class _CombiningMarkTable(dict):
+    """str.translate table that drops nonspacing marks (category Mn).
+
+    Filled lazily per code point, so later lookups stay inside the C
+    translate loop instead of calling unicodedata for every character.
+    """
+    def __missing__(self, codepoint: int):
+        value = None if unicodedata.category(chr(codepoint)) == 'Mn' else codepoint
+        self[codepoint] = value
+        return value
+
+
+COMBINING_MARKS = _CombiningMarkTable()
+# Pre-seed the Mn code points of the combining blocks NFD emits for Latin/Slavic text
+COMBINING_MARKS.update(
+    (codepoint, None)
+    for start, stop in ((0x0300, 0x0370), (0x1AB0, 0x1B00), (0x1DC0, 0x1E00),
+                        (0x20D0, 0x2100), (0xFE20, 0xFE30))
+    for codepoint in range(start, stop)
+    if unicodedata.category(chr(codepoint)) == 'Mn'
+)
+
+
+def _build_ascii_fold_table() -> Dict[int, str]:
+    """Map precomposed Latin letters (U+00C0-U+024F, incl. č/š/ž) to their ASCII base."""
+    table = {}
+    for codepoint in range(0x00C0, 0x0250):
+        base = unicodedata.normalize('NFD', chr(codepoint)).translate(COMBINING_MARKS)
+        if base and base.isascii():
+            table[codepoint] = base
+    return table
+
+
+ASCII_FOLD = _build_ascii_fold_table()
+
+
+@lru_cache(maxsize=1024)
 def to_slug(value: str) -> str:
     """Convert text to URL-safe slug."""
     text = str(value or "").strip().lower()
-    # Remove diacritics
-    text = unicodedata.normalize('NFD', text)
-    text = ''.join(ch for ch in text if unicodedata.category(ch) != 'Mn')
-    # Replace non-alphanumeric with hyphens
-    text = re.sub(r"[^a-z0-9]+", "-", text)
-    text = re.sub(r"(^-|-$)", "", text)
-    return text
+    # Remove diacritics: fold common Latin letters via the table and only
+    # fall back to NFD for whatever non-ASCII text is left
+    if not text.isascii():
+        text = text.translate(ASCII_FOLD)
+        if not text.isascii():
+            text = unicodedata.normalize('NFD', text).translate(COMBINING_MARKS)
+    # Replace non-alphanumeric runs with hyphens and trim them at the edges
+    return SLUG_INVALID_RE.sub("-", text).strip("-")
+
+
+_clock_cache: Dict[str, Any] = {'at': None, 'date': '', 'iso': '', 'tz': None, 'tz_slot': None}
+
+
+def _local_tz(now_utc: datetime) -> tzinfo:
+    """Resolve the local UTC offset once per TZ_RECHECK_SECONDS slot."""
+    slot = int(now_utc.timestamp()) // TZ_RECHECK_SECONDS
+    if slot != _clock_cache['tz_slot']:
+        _clock_cache.update(tz=now_utc.astimezone().tzinfo, tz_slot=slot)
+    return _clock_cache['tz']
+
+
+def _refresh_clock() -> Dict[str, Any]:
+    """Reuse one datetime.now() for calls made within CLOCK_CACHE_SECONDS."""
+    now = time.monotonic()
+    at = _clock_cache['at']
+    if at is None or now - at > CLOCK_CACHE_SECONDS:
+        now_utc = datetime.now(timezone.utc)
+        current = now_utc.astimezone(_local_tz(now_utc))
+        _clock_cache.update(at=now,
+                            date=current.strftime("%Y-%m-%d"),
+                            iso=current.isoformat(timespec='seconds'))
+    return _clock_cache
 
 
 def today_date_str() -> str:
     """Get today's date in YYYY-MM-DD format."""
-    return datetime.now().strftime("%Y-%m-%d")
+    return _refresh_clock()['date']
 
 
 def now_iso_local() -> str:
     """Get current datetime in ISO format with timezone."""
-    return datetime.now().astimezone().isoformat(timespec='seconds')
+    return _refresh_clock()['iso']
 
 
 def ensure_dir(path: Path) -> None:
@@ -57,60 +143,224 @@ def ensure_dir(path: Path) -> None:
     path.mkdir(parents=True, exist_ok=True)
 
 
-def get_file_size_mb(path: Path) -> float:
-    """Get file size in megabytes."""
-    return path.stat().st_size / (1024 * 1024)
+def write_file_bytes(path: Path, data: bytes) -> None:
+    """Write data to path through a raw file descriptor (no buffered/text layers)."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0), 0o666)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
 
 
-def validate_image(path: Path) -> Tuple[bool, str]:
-    """Validate image file."""
-    if not path.exists():
-        return False, "File does not exist"
+def text_has_content(widget) -> bool:
+    """True if a Text widget holds any non-whitespace, found without copying its contents."""
+    return bool(widget.search(r"\S", "1.0", "end-1c", regexp=True))
+
+
+def validate_image(path: Path) -> Tuple[bool, str, float]:
+    """Validate image file. Returns (valid, error, size_mb) from a single stat."""
+    try:
+        st = path.stat()
+    except OSError:
+        return False, "File does not exist", 0.0
+    
+    if not stat.S_ISREG(st.st_mode):
+        return False, "Not a regular file", 0.0
     
     if path.suffix.lower() not in SUPPORTED_IMAGE_FORMATS:
-        return False, f"Unsupported format. Supported: {', '.join(SUPPORTED_IMAGE_FORMATS)}"
+        return False, f"Unsupported format. Supported: {', '.join(SUPPORTED_IMAGE_FORMATS)}", 0.0
     
-    size_mb = get_file_size_mb(path)
+    size_mb = st.st_size / (1024 * 1024)
     if size_mb > MAX_IMAGE_SIZE_MB:
-        return False, f"File too large ({size_mb:.1f}MB). Maximum: {MAX_IMAGE_SIZE_MB}MB"
+        return False, f"File too large ({size_mb:.1f}MB). Maximum: {MAX_IMAGE_SIZE_MB}MB", size_mb
     
-    return True, ""
+    return True, "", size_mb
 
 
-def copy_image_to_uploads(src_path: Path, dest_dir: Path, dest_filename: str) -> Path:
-    """Copy image to uploads directory with unique name."""
-    ensure_dir(dest_dir)
+def _copy_file_range(src_path: Path, dest_path: Path, size: int) -> bool:
+    """Copy with os.copy_file_range. Returns False if the kernel cannot do it."""
+    with open(src_path, 'rb', buffering=0) as fsrc, open(dest_path, 'wb', buffering=0) as fdst:
+        src_fd, dst_fd = fsrc.fileno(), fdst.fileno()
+        copied = 0
+        try:
+            while copied < size:
+                n = os.copy_file_range(src_fd, dst_fd, size - copied, copied, copied)
+                if n == 0:
+                    return False
+                copied += n
+        except OSError:
+            # e.g. cross-device copies on older kernels
+            return False
+    return True
+
+
+def fast_copy_file(src_path: Path, dest_path: Path) -> None:
+    """Copy file contents and timestamps.
+
+    shutil.copyfile already uses sendfile/fcopyfile; copy_file_range is only
+    tried first because it can reflink on copy-on-write filesystems.
+    """
+    st = os.stat(src_path)
+    if not (hasattr(os, 'copy_file_range') and _copy_file_range(src_path, dest_path, st.st_size)):
+        shutil.copyfile(src_path, dest_path)
+    # Only timestamps matter for uploads; skip copystat's mode/flags/xattr walk
+    os.utime(dest_path, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+
+def list_dir_names(path: Path) -> Set[str]:
+    """Names of all entries in a directory, read with a single scandir."""
+    with os.scandir(path) as it:
+        return {entry.name for entry in it}
+
+
+def reserve_upload_path(src_path: Path, dest_dir: Path, dest_filename: str,
+                        existing: Optional[Set[str]] = None) -> Path:
+    """Pick a free name in dest_dir for src_path without copying anything.
+
+    Pass the same ``existing`` set (from list_dir_names) for several images
+    going into one folder to avoid re-listing it; the chosen name is added to it.
+    """
     ext = src_path.suffix.lower()
-    target = dest_dir / f"{dest_filename}{ext}"
-    # Avoid overwriting by adding numeric suffix if needed
+    # Avoid overwriting by adding numeric suffix if needed; names are checked
+    # against one folder listing instead of a stat per candidate
+    if existing is None:
+        existing = list_dir_names(dest_dir)
+    name = f"{dest_filename}{ext}"
     counter = 2
-    while target.exists():
-        target = dest_dir / f"{dest_filename}-{counter}{ext}"
+    while name in existing:
+        name = f"{dest_filename}-{counter}{ext}"
         counter += 1
-    shutil.copy2(src_path, target)
+    existing.add(name)
+    return dest_dir / name
+
+
+def copy_image(src_path: Path, target: Path) -> Path:
+    """Copy an image to an already reserved target path."""
+    fast_copy_file(src_path, target)
     return target
 
 
+def add_file_to_zip(zf: "zipfile.ZipFile", path: Path, arcname: str) -> None:
+    """Add a file to the ZIP, storing already-compressed images uncompressed."""
+    import zipfile
+    if path.suffix.lower() not in PRECOMPRESSED_IMAGE_FORMATS:
+        zf.write(path, arcname=arcname)
+        return
+    zinfo = zipfile.ZipInfo.from_file(path, arcname=arcname)
+    zinfo.compress_type = zipfile.ZIP_STORED
+    with open(path, 'rb') as src, zf.open(zinfo, 'w') as dest:
+        if zinfo.file_size > COPY_BUFSIZE:
+            # Large images: let the kernel page the file in instead of copying chunks
+            with mmap.mmap(src.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                dest.write(mapped)
+        else:
+            shutil.copyfileobj(src, dest, COPY_BUFSIZE)
+
+
+def find_latest_zip(directory: Path, prefix: str) -> Optional[Path]:
+    """Return the most recently modified <prefix>*.zip in directory, if any."""
+    latest = None
+    latest_mtime = -1.0
+    try:
+        with os.scandir(directory) as it:
+            for entry in it:
+                name = entry.name
+                if not (name.startswith(prefix) and name.endswith('.zip')):
+                    continue
+                mtime = entry.stat().st_mtime
+                if mtime > latest_mtime:
+                    latest_mtime = mtime
+                    latest = Path(entry.path)
+    except FileNotFoundError:
+        return None
+    return latest
+
+
+def zip_files_match(a: Path, b: Path, probe: int = 64 * 1024) -> bool:
+    """Cheaply tell whether two ZIPs are the same archive.
+
+    Compares sizes, then the first and last ``probe`` bytes. The tail holds
+    the central directory with every entry's CRC-32, so differing contents
+    show up there without reading the whole file.
+    """
+    try:
+        size = a.stat().st_size
+        if b.stat().st_size != size:
+            return False
+        with open(a, 'rb') as fa, open(b, 'rb') as fb:
+            if fa.read(probe) != fb.read(probe):
+                return False
+            if size > probe:
+                tail = max(size - probe, probe)
+                fa.seek(tail)
+                fb.seek(tail)
+                return fa.read() == fb.read()
+            return True
+    except OSError:
+        return False
+
+
 def yaml_escape(text: str) -> str:
     """Escape text for YAML frontmatter."""
     if text is None:
         return ""
-    s = str(text)
-    # Quote if contains special characters
-    if re.search(r'[":>#\[\],{}|]', s) or s.strip() != s or '\n' in s:
+    s = text if isinstance(text, str) else str(text)
+    # Fast path: plain ASCII words need no quoting
+    if s and s[0] != ' ' and s[-1] != ' ' and YAML_SAFE_CHARS.issuperset(s):
+        return s
+    # Quote if contains special characters or leading/trailing whitespace
+    # (checking the two end characters avoids a stripped copy of the string)
+    if s and (s[0].isspace() or s[-1].isspace() or not YAML_SPECIAL_CHARS.isdisjoint(s)):
         # escape quotes and backslashes
-        s = s.replace('\\', '\\\\').replace('"', '\\"')
+        if '\\' in s:
+            s = s.replace('\\', '\\\\')
+        if '"' in s:
+            s = s.replace('"', '\\"')
         return f'"{s}"'
     return s
 
 
+def render_frontmatter(title: str, date_str: str, slug: str, author: str = "",
+                       summary: str = "", image_url: str = "", image_alt: str = "",
+                       tags: Tuple[str, ...] = (), draft: bool = True,
+                       dt_iso: str = "") -> List[str]:
+    """Build the frontmatter lines, including both '---' fences.
+
+    Compatible with the site spec (date as YYYY-MM-DD). Optional fields are
+    only written when set; the caller appends the body and joins once.
+    """
+    fm_lines = [
+        "---",
+        f"title: {yaml_escape(title)}",
+        f"date: {date_str}",
+        f"slug: {yaml_escape(slug)}",
+    ]
+    if author:
+        fm_lines.append(f"author: {yaml_escape(author)}")
+    if summary:
+        # Trim to ~200 characters to align with site expectations
+        fm_lines.append(f"summary: {yaml_escape(summary[:200].rstrip())}")
+    if image_url:
+        fm_lines.append(f"image: {yaml_escape(image_url)}")
+    if image_alt:
+        fm_lines.append(f"imageAlt: {yaml_escape(image_alt)}")
+    if tags:
+        # YAML inline list: [tag1, tag2]
+        fm_lines.append(f"tags: [{', '.join(map(yaml_escape, tags))}]")
+    # Always write draft flag for safety
+    fm_lines.append(f"draft: {'true' if draft else 'false'}")
+    # Keep the full datetime for human reference; site ignores unknown fields
+    if dt_iso:
+        fm_lines.append(f"datetime: {yaml_escape(dt_iso)}")
+    fm_lines.append("---")
+    return fm_lines
+
+
 def sanitize_filename(filename: str) -> str:
     """Sanitize filename for safe file operations."""
-    # Remove path separators and other dangerous characters
-    filename = re.sub(r'[<>:"/\\|?*]', '_', filename)
-    # Remove control characters
-    filename = ''.join(ch for ch in filename if ord(ch) >= 32)
-    return filename[:255]  # Limit length
+    return filename.translate(FILENAME_TABLE)[:255]  # Limit length
 
 
 class _Tooltip:
@@ -146,14 +396,19 @@ class NewsGeneratorApp:
     def __init__(self, master: tk.Tk):
         self.master = master
         master.title(APP_TITLE)
+        # Build the form while hidden so Tk lays it out once, not per widget
+        master.withdraw()
 
         # State
         self.hero_image_path: Optional[Path] = None
         self.additional_images: List[Path] = []
+        self._additional_images_set: Set[Path] = set()  # O(1) duplicate checks
         self.last_generated_paths: List[Path] = []
         self.last_zip_path: Optional[Path] = None
         self.settings = self.load_settings()
         self.is_generating = False
+        self.is_zipping = False
+        self._slug_after_id: Optional[str] = None
 
         # Variables
         self.var_title = tk.StringVar()
@@ -264,8 +519,10 @@ class NewsGeneratorApp:
         self._add_tooltip(self.btn_zip, "Packs the draft and images into one ZIP.")
 
         ttk.Button(actions, text="Open Output Folder", command=self.open_output_folder).grid(row=0, column=2, padx=(0,8))
-        ttk.Button(actions, text="Copy ZIP to incoming…", command=self.copy_zip_to_incoming).grid(row=0, column=3, padx=(0,8))
-        ttk.Button(actions, text="Reset Form", command=self.reset_form).grid(row=0, column=4, padx=(0,8))
+        self.btn_copy = ttk.Button(actions, text="Copy ZIP to incoming…", command=self.copy_zip_to_incoming)
+        self.btn_copy.grid(row=0, column=3, padx=(0,8))
+        self.btn_reset = ttk.Button(actions, text="Reset Form", command=self.reset_form)
+        self.btn_reset.grid(row=0, column=4, padx=(0,8))
         ttk.Button(actions, text="How it works", command=self.show_help).grid(row=0, column=5)
 
         # Status
@@ -282,7 +539,17 @@ class NewsGeneratorApp:
         for c in range(4):
             container.columnconfigure(c, weight=1 if c in (1,2) else 0)
 
+        master.update_idletasks()
+        master.deiconify()
+
     def _on_title_change(self, _event=None):
+        # Debounce: only regenerate the slug once typing pauses
+        if self._slug_after_id is not None:
+            self.master.after_cancel(self._slug_after_id)
+        self._slug_after_id = self.master.after(SLUG_DEBOUNCE_MS, self._update_slug_from_title)
+
+    def _update_slug_from_title(self):
+        self._slug_after_id = None
         if not self.var_slug.get().strip():
             self.var_slug.set(to_slug(self.var_title.get()))
 
@@ -294,248 +561,350 @@ class NewsGeneratorApp:
                                           filetypes=[("Images", "*.jpg *.jpeg *.png *.gif *.webp *.svg"), ("All files", "*.*")])
         if path:
             image_path = Path(path)
-            valid, error = validate_image(image_path)
+            valid, error, size_mb = validate_image(image_path)
             
             if not valid:
                 messagebox.showwarning("Invalid Image", f"Cannot use this image:\n{error}")
                 return
                 
             self.hero_image_path = image_path
-            size_mb = get_file_size_mb(image_path)
             self.lbl_hero.config(text=f"{image_path.name} ({size_mb:.1f}MB)")
 
     def add_images(self):
         paths = filedialog.askopenfilenames(title="Choose additional images",
                                             filetypes=[("Images", "*.jpg *.jpeg *.png *.gif *.webp *.svg"), ("All files", "*.*")])
+        labels = []
         for p in paths:
             pth = Path(p)
-            valid, error = validate_image(pth)
+            valid, error, size_mb = validate_image(pth)
             
             if not valid:
                 messagebox.showwarning("Invalid Image", f"Cannot add {pth.name}:\n{error}")
                 continue
                 
-            if pth not in self.additional_images:
+            if pth not in self._additional_images_set:
+                self._additional_images_set.add(pth)
                 self.additional_images.append(pth)
-                size_mb = get_file_size_mb(pth)
-                self.lst_images.insert(tk.END, f"{pth.name} ({size_mb:.1f}MB)")
+                labels.append(f"{pth.name} ({size_mb:.1f}MB)")
+        # One Tcl call for the whole selection instead of one per file
+        if labels:
+            self.lst_images.insert(tk.END, *labels)
 
     def remove_selected_image(self):
-        sel = list(self.lst_images.curselection())
-        sel.reverse()
-        for idx in sel:
-            del self.additional_images[idx]
-            self.lst_images.delete(idx)
-
-    def _validate_inputs(self) -> Tuple[bool, str]:
+        sel = self.lst_images.curselection()
+        # Remove contiguous runs from the end (earlier indices stay valid),
+        # one Listbox.delete and one slice delete per run
+        end = len(sel)
+        while end:
+            start = end - 1
+            while start and sel[start - 1] == sel[start] - 1:
+                start -= 1
+            first, last = sel[start], sel[end - 1]
+            self._additional_images_set.difference_update(self.additional_images[first:last + 1])
+            del self.additional_images[first:last + 1]
+            self.lst_images.delete(first, last)
+            end = start
+
+    def _collect_form(self) -> Dict[str, Any]:
+        """Read every form widget once into plain values."""
         title = self.var_title.get().strip()
-        if not title:
+        return {
+            'title': title,
+            'date_str': self.var_date.get().strip(),
+            'dt_iso': self.var_datetime.get().strip() or now_iso_local(),
+            'author': self.var_author.get().strip(),
+            'slug': to_slug(self.var_slug.get() or title),
+            'summary': self.txt_summary.get("1.0", "end-1c").strip().replace("\n", " "),
+            'tags': [t.strip() for t in self.var_tags.get().split(',') if t.strip()],
+            'draft': bool(self.var_draft.get()),
+            'image_alt': self.var_image_alt.get().strip() or title,
+            'body': self.txt_body.get("1.0", "end-1c").rstrip(),
+            'hero_image_path': self.hero_image_path,
+            'additional_images': list(self.additional_images),
+        }
+
+    def _validate_inputs(self, params: Dict[str, Any]) -> Tuple[bool, str]:
+        if not params['title']:
             return False, "Title is required."
-        date_str = self.var_date.get().strip()
-        if not re.match(r"^\d{4}-\d{2}-\d{2}$", date_str):
+        date_str = params['date_str']
+        if not DATE_RE.match(date_str):
             return False, "Date must be in YYYY-MM-DD format."
+        # The regex guarantees zero-padded digits, so the calendar check only
+        # needs the date constructor rather than a full strptime parse
         try:
-            datetime.strptime(date_str, "%Y-%m-%d")
-        except Exception:
+            datetime(int(date_str[:4]), int(date_str[5:7]), int(date_str[8:]))
+        except ValueError:
             return False, "Date is not a valid calendar date."
-        slug = to_slug(self.var_slug.get() or self.var_title.get())
-        if not re.match(r"^[a-z0-9]+(?:-[a-z0-9]+)*$", slug):
+        if not SLUG_RE.match(params['slug']):
             return False, "Slug must be lowercase letters/numbers with hyphens."
-        summary = self.txt_summary.get("1.0", tk.END).strip()
-        if not summary:
+        if not params['summary']:
             return False, "Summary is required."
         return True, ""
 
+    def _run_in_background(self, work, on_done, on_error):
+        """Run work(report) on a worker thread; callbacks run on the Tk thread.
+
+        The worker must not touch Tk widgets. It posts progress text through
+        report(), which is drained into the progress label every 50 ms.
+        """
+        events: "queue.Queue[Tuple[str, Any]]" = queue.Queue()
+
+        def target():
+            try:
+                result = work(lambda text: events.put(('progress', text)))
+            except Exception as e:
+                traceback.print_exc()
+                events.put(('error', e))
+            else:
+                events.put(('done', result))
+
+        threading.Thread(target=target, daemon=True).start()
+        self.master.after(50, self._drain_events, events, on_done, on_error)
+
+    def _drain_events(self, events, on_done, on_error):
+        while True:
+            try:
+                kind, payload = events.get_nowait()
+            except queue.Empty:
+                break
+            if kind == 'progress':
+                self.progress_label.config(text=payload)
+                continue
+            self.progress_label.config(text="")
+            if kind == 'done':
+                on_done(payload)
+            else:
+                on_error(payload)
+            return
+        self.master.after(50, self._drain_events, events, on_done, on_error)
+
     def generate_draft(self):
-        if self.is_generating:
+        if self.is_busy():
             return
             
-        ok, msg = self._validate_inputs()
+        # Collect data on the UI thread; the worker only sees plain values
+        params = self._collect_form()
+        ok, msg = self._validate_inputs(params)
         if not ok:
             messagebox.showerror("Invalid input", msg)
             return
 
-        self.is_generating = True
-        self.btn_gen.config(state='disabled')
+        # Save author preference (only when it changed)
+        if params['author'] and params['author'] != self.settings.get('default_author'):
+            self.settings['default_author'] = params['author']
+            self.save_settings()
+
+        self._set_generating(True)
         self.progress_label.config(text="Generating draft...")
-        self.master.update()
+        self._run_in_background(lambda report: self._write_draft_files(params, report),
+                                self._on_draft_generated, self._on_draft_failed)
+
+    def is_busy(self) -> bool:
+        """True while a worker is writing the draft or its ZIP."""
+        return self.is_generating or self.is_zipping
+
+    def _set_generating(self, busy: bool):
+        self.is_generating = busy
+        self._update_action_buttons()
+
+    def _set_zipping(self, busy: bool):
+        self.is_zipping = busy
+        self._update_action_buttons()
+
+    def _update_action_buttons(self):
+        # Drafts and ZIPs share files on disk: while either is being written,
+        # nothing may read, rewrite or clear them
+        state = 'disabled' if self.is_busy() else 'normal'
+        for button in (self.btn_gen, self.btn_zip, self.btn_copy, self.btn_reset):
+            button.config(state=state)
+
+    def _write_draft_files(self, params: Dict[str, Any], report) -> Tuple[Path, Path, List[Path]]:
+        """Copy images and write the markdown file. Runs on a worker thread.
+
+        Returns the markdown path, the uploads folder and every written file
+        relative to OUTPUT_ROOT.
+        """
+        title = params['title']
+        date_str = params['date_str']
+        dt_iso = params['dt_iso']
+        author = params['author']
+        slug = params['slug']
+        summary = params['summary']
+        tags = params['tags']
+        draft = params['draft']
+        image_alt = params['image_alt']
+        body = params['body']
+        additional_images = params['additional_images']
+
+        year, month = date_str[:4], date_str[5:7]
+
+        # Prepare output dirs
+        report("Creating directories...")
+        # Relative forms are kept so last_generated_paths needs no relative_to()
+        content_rel = Path("content", "news")
+        uploads_rel = Path("static", "uploads", "news", year, month)
+        content_dir = OUTPUT_ROOT / content_rel
+        uploads_dir = OUTPUT_ROOT / uploads_rel
+        ensure_dir(content_dir)
+        ensure_dir(uploads_dir)
+        existing_uploads = list_dir_names(uploads_dir)
+
+        # Date and slug are validated, so the shared name prefix is sanitized once;
+        # to_slug() output appended below is always filename-safe
+        name_prefix = sanitize_filename(f"{date_str}-{slug}")
+
+        # Reserve every target name up front so the copies can run in parallel
+        jobs: List[Tuple[Path, Path]] = []
+        hero_path = params['hero_image_path']
+        if hero_path:
+            hero_base = f"{name_prefix}-hero"
+            jobs.append((hero_path, reserve_upload_path(hero_path, uploads_dir, hero_base, existing_uploads)))
+        for i, add_path in enumerate(additional_images):
+            base_name = add_path.stem
+            desc = to_slug(base_name)
+            if not desc or desc == "hero":
+                desc = f"image-{i+1}"
+            add_base = f"{name_prefix}-{desc}"
+            jobs.append((add_path, reserve_upload_path(add_path, uploads_dir, add_base, existing_uploads)))
+
+        # Copy images (progress reports are throttled)
+        written_rel: List[Path] = [uploads_rel / target.name for _src, target in jobs]
+        if jobs:
+            from concurrent.futures import ThreadPoolExecutor, as_completed
+            total = len(jobs)
+            last_ui = 0.0
+            with ThreadPoolExecutor(max_workers=min(MAX_COPY_WORKERS, total)) as pool:
+                futures = [pool.submit(copy_image, src, target) for src, target in jobs]
+                for done, future in enumerate(as_completed(futures), 1):
+                    future.result()
+                    now = time.monotonic()
+                    if now - last_ui >= PROGRESS_INTERVAL:
+                        report(f"Copied image {done}/{total}...")
+                        last_ui = now
+
+        image_url = ""
+        if hero_path:
+            # Absolute web path, built from strings: always "/", whatever the OS separator
+            image_url = f"/static/uploads/news/{year}/{month}/{jobs[0][1].name}"
+
+        # Build frontmatter (compatible with site spec; date as YYYY-MM-DD)
+        report("Creating content...")
+        fm_lines = render_frontmatter(
+            title, date_str, slug, author=author, summary=summary,
+            image_url=image_url, image_alt=image_alt, tags=tuple(tags),
+            draft=draft, dt_iso=dt_iso,
+        )
 
-        try:
-            # Collect data
-            title = self.var_title.get().strip()
-            date_str = self.var_date.get().strip()
-            dt_iso = self.var_datetime.get().strip() or now_iso_local()
-            author = self.var_author.get().strip()
-            slug = to_slug(self.var_slug.get() or title)
-            summary = self.txt_summary.get("1.0", tk.END).strip().replace("\n", " ")
-            tags_raw = [t.strip() for t in self.var_tags.get().split(',') if t.strip()]
-            tags = tags_raw
-            draft = bool(self.var_draft.get())
-            image_alt = self.var_image_alt.get().strip() or title
-            body = self.txt_body.get("1.0", tk.END).rstrip()
-
-            # Save author preference
-            if author:
-                self.settings['default_author'] = author
-                self.save_settings()
-
-            year, month = date_str.split('-')[0], date_str.split('-')[1]
-
-            # Prepare output dirs
-            self.progress_label.config(text="Creating directories...")
-            self.master.update()
-            
-            content_dir = OUTPUT_ROOT / "content" / "news"
-            uploads_dir = OUTPUT_ROOT / "static" / "uploads" / "news" / year / month
-            ensure_dir(content_dir)
-            ensure_dir(uploads_dir)
-
-            # Copy images
-            image_url = ""
-            written_paths: List[Path] = []
-            if self.hero_image_path:
-                self.progress_label.config(text="Processing hero image...")
-                self.master.update()
-                
-                hero_base = sanitize_filename(f"{date_str}-{slug}-hero")
-                copied = copy_image_to_uploads(self.hero_image_path, uploads_dir, hero_base)
-                # Compute absolute web path
-                image_url = "/" + "/".join(copied.relative_to(OUTPUT_ROOT).parts)
-                image_url = image_url.replace("\\", "/")
-                written_paths.append(copied)
-
-            # Additional images
-            for i, add_path in enumerate(self.additional_images):
-                self.progress_label.config(text=f"Processing image {i+1}/{len(self.additional_images)}...")
-                self.master.update()
-                
-                base_name = add_path.stem
-                desc = to_slug(base_name)
-                if not desc or desc == "hero":
-                    desc = f"image-{i+1}"
-                add_base = sanitize_filename(f"{date_str}-{slug}-{desc}")
-                copied = copy_image_to_uploads(add_path, uploads_dir, add_base)
-                written_paths.append(copied)
-
-            # Build frontmatter (compatible with site spec; date as YYYY-MM-DD)
-            self.progress_label.config(text="Creating content...")
-            self.master.update()
-            
-            fm_lines = [
-                "---",
-                f"title: {yaml_escape(title)}",
-                f"date: {date_str}",
-                f"slug: {yaml_escape(slug)}",
-            ]
-            if author:
-                fm_lines.append(f"author: {yaml_escape(author)}")
-            if summary:
-                # Trim to ~200 characters to align with site expectations
-                short = summary[:200].rstrip()
-                fm_lines.append(f"summary: {yaml_escape(short)}")
-            if image_url:
-                fm_lines.append(f"image: {yaml_escape(image_url)}")
-            if image_alt:
-                fm_lines.append(f"imageAlt: {yaml_escape(image_alt)}")
-            if tags:
-                # YAML inline list: [tag1, tag2]
-                tags_escaped = ", ".join(yaml_escape(t) for t in tags)
-                fm_lines.append(f"tags: [{tags_escaped}]")
-            # Always write draft flag for safety
-            fm_lines.append(f"draft: {'true' if draft else 'false'}")
-            # Keep the full datetime for human reference; site ignores unknown fields
-            if dt_iso:
-                fm_lines.append(f"datetime: {yaml_escape(dt_iso)}")
-            fm_lines.append("---")
-
-            # Markdown body
-            if not body.strip():
-                body = "Write your content here."
-
-            content = "\n".join(fm_lines) + "\n\n" + body + "\n"
-
-            # Filename and write
-            filename = sanitize_filename(f"{date_str}-{slug}.md")
-            md_path = content_dir / filename
-            md_path.write_text(content, encoding='utf-8')
-            written_paths.append(md_path)
-
-            # Save last generated set (relative to OUTPUT_ROOT)
-            rel_written = [p.relative_to(OUTPUT_ROOT) for p in written_paths]
-            self.last_generated_paths = rel_written
-
-            self.progress_label.config(text="")
-            self.var_status.set(f"Draft generated: {md_path.name}")
-            messagebox.showinfo("Success", f"Draft created at:\n{md_path.name}\n\nImages (if any) were copied under:\n{uploads_dir}")
-            
-        except Exception as e:
-            self.progress_label.config(text="")
-            messagebox.showerror("Error", f"Failed to generate draft:\n{str(e)}")
-            traceback.print_exc()
-            
-        finally:
-            self.is_generating = False
-            self.btn_gen.config(state='normal')
+        # Markdown body
+        if not body.strip():
+            body = "Write your content here."
+
+        # Blank line, body and trailing newline go through the same single join
+        fm_lines.extend(("", body, ""))
+        content = "\n".join(fm_lines)
+
+        # Filename and write
+        filename = f"{name_prefix}.md"
+        md_path = content_dir / filename
+        write_file_bytes(md_path, content.encode('utf-8'))
+        written_rel.append(content_rel / filename)
+        return md_path, uploads_dir, written_rel
+
+    def _on_draft_generated(self, result: Tuple[Path, Path, List[Path]]):
+        md_path, uploads_dir, written_rel = result
+        # Save last generated set (relative to OUTPUT_ROOT)
+        self.last_generated_paths = written_rel
+        self._set_generating(False)
+        self.var_status.set(f"Draft generated: {md_path.name}")
+        messagebox.showinfo("Success", f"Draft created at:\n{md_path.name}\n\nImages (if any) were copied under:\n{uploads_dir}")
+
+    def _on_draft_failed(self, error: Exception):
+        self._set_generating(False)
+        messagebox.showerror("Error", f"Failed to generate draft:\n{str(error)}")
 
     def create_zip(self):
+        if self.is_busy():
+            return
         if not self.last_generated_paths:
             messagebox.showwarning("Nothing to zip", "Generate a draft first.")
             return
 
-        self.progress_label.config(text="Creating ZIP file...")
-        self.master.update()
-
-        try:
-            # Try to find the markdown file in the last set to name the zip
-            md_rel = None
-            for p in self.last_generated_paths:
-                if p.as_posix().endswith('.md'):
-                    md_rel = p
-                    break
-            if md_rel is None:
-                messagebox.showerror("Error", "Could not locate the markdown file to name the ZIP.")
-                return
+        # Try to find the markdown file in the last set to name the zip
+        md_rel = None
+        for p in self.last_generated_paths:
+            if p.as_posix().endswith('.md'):
+                md_rel = p
+                break
+        if md_rel is None:
+            messagebox.showerror("Error", "Could not locate the markdown file to name the ZIP.")
+            return
 
-            slug_part = md_rel.name[:-3]
-            zip_name = sanitize_filename(f"news-draft-{slug_part}.zip")
-            dist_dir = OUTPUT_ROOT
-            ensure_dir(dist_dir)
-            zip_path = dist_dir / zip_name
+        slug_part = md_rel.name[:-3]
+        zip_name = sanitize_filename(f"news-draft-{slug_part}.zip")
+        rel_paths = list(self.last_generated_paths)
 
-            with zipfile.ZipFile(zip_path, 'w', compression=zipfile.ZIP_DEFLATED) as zf:
-                for rel in self.last_generated_paths:
+        self._set_zipping(True)
+        self.progress_label.config(text="Creating ZIP file...")
+        self._run_in_background(lambda report: self._write_zip(zip_name, rel_paths),
+                                self._on_zip_created, self._on_zip_failed)
+
+    def _write_zip(self, zip_name: str, rel_paths: List[Path]) -> Path:
+        """Pack the generated files into a ZIP. Runs on a worker thread."""
+        dist_dir = OUTPUT_ROOT
+        ensure_dir(dist_dir)
+        zip_path = dist_dir / zip_name
+        # Write under a temporary name and swap it in, so find_latest_zip and
+        # "Copy ZIP to incoming" never see a half-written archive
+        tmp_path = zip_path.with_name(zip_name + '.part')
+
+        import zipfile
+        try:
+            with zipfile.ZipFile(tmp_path, 'w', compression=zipfile.ZIP_DEFLATED, compresslevel=1) as zf:
+                for rel in rel_paths:
                     abs_path = OUTPUT_ROOT / rel
                     if abs_path.is_file():
                         # Keep content/ and static/ folder roots inside the archive
-                        zf.write(abs_path, arcname=str(rel))
+                        add_file_to_zip(zf, abs_path, rel.as_posix())
+            os.replace(tmp_path, zip_path)
+        except Exception:
+            tmp_path.unlink(missing_ok=True)
+            raise
+        return zip_path
 
-            self.last_zip_path = zip_path
-            self.progress_label.config(text="")
-            self.var_status.set(f"ZIP created: {zip_name}")
-            messagebox.showinfo("ZIP ready", f"ZIP created at:\n{zip_name}\n\nYou can now copy it into your website folder's incoming/ directory.")
-            
-        except Exception as e:
-            self.progress_label.config(text="")
-            messagebox.showerror("Error", f"Failed to create ZIP:\n{str(e)}")
+    def _on_zip_created(self, zip_path: Path):
+        self.last_zip_path = zip_path
+        self._set_zipping(False)
+        self.var_status.set(f"ZIP created: {zip_path.name}")
+        messagebox.showinfo("ZIP ready", f"ZIP created at:\n{zip_path.name}\n\nYou can now copy it into your website folder's incoming/ directory.")
+
+    def _on_zip_failed(self, error: Exception):
+        self._set_zipping(False)
+        messagebox.showerror("Error", f"Failed to create ZIP:\n{str(error)}")
 
     def open_output_folder(self):
         ensure_dir(OUTPUT_ROOT)
         try:
+            # Launch without waiting: xdg-open can block until the file manager
+            # exits, which would freeze the Tk event loop
             if sys.platform == 'win32':
                 os.startfile(str(OUTPUT_ROOT))
-            elif sys.platform == 'darwin':
-                subprocess.run(['open', str(OUTPUT_ROOT)], check=False)
             else:
-                subprocess.run(['xdg-open', str(OUTPUT_ROOT)], check=False)
+                import subprocess
+                opener = 'open' if sys.platform == 'darwin' else 'xdg-open'
+                proc = subprocess.Popen([opener, str(OUTPUT_ROOT)], start_new_session=True)
+                # Reap it off the UI thread so it doesn't linger as a zombie
+                threading.Thread(target=proc.wait, daemon=True).start()
         except Exception as e:
             messagebox.showerror("Cannot open folder", f"Please open this folder manually:\n{OUTPUT_ROOT}\n\nError: {e}")
 
     def copy_zip_to_incoming(self):
+        if self.is_busy():
+            return
         if not self.last_zip_path or not self.last_zip_path.exists():
             # Try to find a recent ZIP in OUTPUT_ROOT
-            candidates = sorted(OUTPUT_ROOT.glob('news-draft-*.zip'), key=lambda p: p.stat().st_mtime, reverse=True)
-            if candidates:
-                self.last_zip_path = candidates[0]
+            latest = find_latest_zip(OUTPUT_ROOT, 'news-draft-')
+            if latest is not None:
+                self.last_zip_path = latest
             else:
                 messagebox.showwarning("No ZIP found", "Please click 'Create ZIP' first.")
                 return
@@ -552,9 +921,14 @@ class NewsGeneratorApp:
         try:
             incoming_dir.mkdir(parents=True, exist_ok=True)
             dest = incoming_dir / self.last_zip_path.name
-            shutil.copy2(self.last_zip_path, dest)
-            self.var_status.set(f"Copied ZIP to: {dest.name}")
-            messagebox.showinfo("Copied", f"ZIP copied to:\n{dest.name}\n\nCommit and push this to GitHub (main). The site will import it automatically.")
+            # Re-sending the same ZIP leaves the identical file in place
+            if zip_files_match(self.last_zip_path, dest):
+                self.var_status.set(f"ZIP already in incoming: {dest.name}")
+                messagebox.showinfo("Already up to date", f"Already up to date in incoming:\n{dest.name}\n\nNothing was copied. Commit and push it to GitHub (main) if you haven't yet.")
+            else:
+                shutil.copyfile(self.last_zip_path, dest)
+                self.var_status.set(f"Copied ZIP to: {dest.name}")
+                messagebox.showinfo("Copied", f"ZIP copied to:\n{dest.name}\n\nCommit and push this to GitHub (main). The site will import it automatically.")
         except Exception as e:
             messagebox.showerror("Copy failed", f"Could not copy to incoming/:\n{e}")
 
@@ -579,6 +953,8 @@ class NewsGeneratorApp:
         return tip
 
     def reset_form(self):
+        if self.is_busy():
+            return
         if self.has_unsaved_changes():
             if not messagebox.askyesno("Reset Form", "You have unsaved changes. Reset anyway?"):
                 return
@@ -595,6 +971,7 @@ class NewsGeneratorApp:
         self.txt_body.delete("1.0", tk.END)
         self.hero_image_path = None
         self.additional_images.clear()
+        self._additional_images_set.clear()
         self.lst_images.delete(0, tk.END)
         self.lbl_hero.config(text="None selected")
         self.last_generated_paths = []
@@ -603,8 +980,8 @@ class NewsGeneratorApp:
     def has_unsaved_changes(self) -> bool:
         """Check if there are unsaved changes"""
         return (self.var_title.get().strip() or
-                self.txt_summary.get("1.0", tk.END).strip() or
-                self.txt_body.get("1.0", tk.END).strip() or
+                text_has_content(self.txt_summary) or
+                text_has_content(self.txt_body) or
                 self.hero_image_path is not None or
                 len(self.additional_images) > 0)
 
@@ -612,8 +989,7 @@ class NewsGeneratorApp:
         """Load saved settings"""
         if SETTINGS_FILE.exists():
             try:
-                with open(SETTINGS_FILE, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+                return json.loads(SETTINGS_FILE.read_bytes())
             except Exception:
                 pass
         return {}
@@ -621,8 +997,9 @@ class NewsGeneratorApp:
     def save_settings(self):
         """Save settings"""
         try:
-            with open(SETTINGS_FILE, 'w', encoding='utf-8') as f:
-                json.dump(self.settings, f, indent=2, ensure_ascii=False)
+            # json.dumps encodes in one C call; json.dump streams many small writes
+            data = json.dumps(self.settings, ensure_ascii=False, separators=(',', ':'))
+            write_file_bytes(SETTINGS_FILE, data.encode('utf-8'))
         except Exception:
             pass
 
@@ -631,7 +1008,17 @@ def main():
     root = tk.Tk()
     # Better default minimum size
     root.minsize(800, 700)
-    NewsGeneratorApp(root)
+    app = NewsGeneratorApp(root)
+
+    # Handle window close
+    def on_closing():
+        # Workers are daemon threads; closing now would leave truncated files in output/
+        if app.is_busy():
+            messagebox.showwarning("Please wait", "Files are still being written. Close the window when it finishes.")
+            return
+        root.destroy()
+
+    root.protocol("WM_DELETE_WINDOW", on_closing)
     root.mainloop()
 
 
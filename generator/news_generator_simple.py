@@ -4,14 +4,21 @@ import os
 import re
 import sys
 import json
-import zipfile
+import mmap
+import queue
 import shutil
+import stat
 import unicodedata
-import subprocess
+import threading
+import time
 import traceback
-from datetime import datetime
+from datetime import datetime, timezone, tzinfo
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Dict, Any, List, Tuple
+from typing import TYPE_CHECKING, Optional, Dict, Any, List, Set, Tuple
+
+if TYPE_CHECKING:
+    import zipfile  # imported lazily where ZIPs are written
 
 try:
     import tkinter as tk
@@ -28,28 +35,103 @@ OUTPUT_ROOT = Path(__file__).parent / "output"
 SETTINGS_FILE = Path(__file__).parent / "settings.json"
 MAX_IMAGE_SIZE_MB = 10  # Maximum image size in MB
 SUPPORTED_IMAGE_FORMATS = {'.jpg', '.jpeg', '.png', '.gif', '.webp', '.svg'}
+WORD_COUNT_DEBOUNCE_MS = 150  # Idle time after the last body keystroke before words are recounted
+CLOCK_CACHE_SECONDS = 0.5  # today_date_str/now_iso_local share one clock read within this window
+TZ_RECHECK_SECONDS = 900  # DST switches fall on quarter-hour boundaries, so re-resolve the offset per slot
+COPY_BUFSIZE = 1024 * 1024  # 1 MiB buffer for streaming images into ZIPs
+# Already-compressed formats are stored in ZIPs as-is; deflating them gains nothing
+PRECOMPRESSED_IMAGE_FORMATS = {'.jpg', '.jpeg', '.png', '.gif', '.webp'}
+
+SLUG_INVALID_RE = re.compile(r"[^a-z0-9]+")
+YAML_SPECIAL_CHARS = frozenset('":>#[],{}|\n')
+YAML_SAFE_CHARS = frozenset("abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789 _-./")
+# Path separators and other dangerous characters become "_", control characters are dropped
+FILENAME_TABLE = {ord(ch): '_' for ch in '<>:"/\\|?*'}
+FILENAME_TABLE.update({code: None for code in range(32)})
+
+
+class _CombiningMarkTable(dict):
+    """str.translate table that drops nonspacing marks (category Mn).
+
+    Filled lazily per code point, so later lookups stay inside the C
+    translate loop instead of calling unicodedata for every character.
+    """
+    def __missing__(self, codepoint: int):
+        value = None if unicodedata.category(chr(codepoint)) == 'Mn' else codepoint
+        self[codepoint] = value
+        return value
+
+
+COMBINING_MARKS = _CombiningMarkTable()
+# Pre-seed the Mn code points of the combining blocks NFD emits for Latin/Slavic text
+COMBINING_MARKS.update(
+    (codepoint, None)
+    for start, stop in ((0x0300, 0x0370), (0x1AB0, 0x1B00), (0x1DC0, 0x1E00),
+                        (0x20D0, 0x2100), (0xFE20, 0xFE30))
+    for codepoint in range(start, stop)
+    if unicodedata.category(chr(codepoint)) == 'Mn'
+)
 
 
+def _build_ascii_fold_table() -> Dict[int, str]:
+    """Map precomposed Latin letters (U+00C0-U+024F, incl. č/š/ž) to their ASCII base."""
+    table = {}
+    for codepoint in range(0x00C0, 0x0250):
+        base = unicodedata.normalize('NFD', chr(codepoint)).translate(COMBINING_MARKS)
+        if base and base.isascii():
+            table[codepoint] = base
+    return table
+
+
+ASCII_FOLD = _build_ascii_fold_table()
+
+
+@lru_cache(maxsize=1024)
 def to_slug(value: str) -> str:
     """Convert text to URL-safe slug."""
     text = str(value or "").strip().lower()
-    # Remove diacritics
-    text = unicodedata.normalize('NFD', text)
-    text = ''.join(ch for ch in text if unicodedata.category(ch) != 'Mn')
-    # Replace non-alphanumeric with hyphens
-    text = re.sub(r"[^a-z0-9]+", "-", text)
-    text = re.sub(r"(^-|-$)", "", text)
-    return text
+    # Remove diacritics: fold common Latin letters via the table and only
+    # fall back to NFD for whatever non-ASCII text is left
+    if not text.isascii():
+        text = text.translate(ASCII_FOLD)
+        if not text.isascii():
+            text = unicodedata.normalize('NFD', text).translate(COMBINING_MARKS)
+    # Replace non-alphanumeric runs with hyphens and trim them at the edges
+    return SLUG_INVALID_RE.sub("-", text).strip("-")
+
+
+_clock_cache: Dict[str, Any] = {'at': None, 'date': '', 'iso': '', 'tz': None, 'tz_slot': None}
+
+
+def _local_tz(now_utc: datetime) -> tzinfo:
+    """Resolve the local UTC offset once per TZ_RECHECK_SECONDS slot."""
+    slot = int(now_utc.timestamp()) // TZ_RECHECK_SECONDS
+    if slot != _clock_cache['tz_slot']:
+        _clock_cache.update(tz=now_utc.astimezone().tzinfo, tz_slot=slot)
+    return _clock_cache['tz']
+
+
+def _refresh_clock() -> Dict[str, Any]:
+    """Reuse one datetime.now() for calls made within CLOCK_CACHE_SECONDS."""
+    now = time.monotonic()
+    at = _clock_cache['at']
+    if at is None or now - at > CLOCK_CACHE_SECONDS:
+        now_utc = datetime.now(timezone.utc)
+        current = now_utc.astimezone(_local_tz(now_utc))
+        _clock_cache.update(at=now,
+                            date=current.strftime("%Y-%m-%d"),
+                            iso=current.isoformat(timespec='seconds'))
+    return _clock_cache
 
 
 def today_date_str() -> str:
     """Get today's date in YYYY-MM-DD format."""
-    return datetime.now().strftime("%Y-%m-%d")
+    return _refresh_clock()['date']
 
 
 def now_iso_local() -> str:
     """Get current datetime in ISO format with timezone."""
-    return datetime.now().astimezone().isoformat(timespec='seconds')
+    return _refresh_clock()['iso']
 
 
 def ensure_dir(path: Path) -> None:
@@ -57,60 +139,192 @@ def ensure_dir(path: Path) -> None:
     path.mkdir(parents=True, exist_ok=True)
 
 
+def write_file_bytes(path: Path, data: bytes) -> None:
+    """Write data to path through a raw file descriptor (no buffered/text layers)."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0), 0o666)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+def text_has_content(widget) -> bool:
+    """True if a Text widget holds any non-whitespace, found without copying its contents."""
+    return bool(widget.search(r"\S", "1.0", "end-1c", regexp=True))
+
+
 def get_file_size_mb(path: Path) -> float:
     """Get file size in megabytes."""
     return path.stat().st_size / (1024 * 1024)
 
 
-def validate_image(path: Path) -> Tuple[bool, str]:
-    """Validate image file."""
-    if not path.exists():
-        return False, "File does not exist"
+def validate_image(path: Path) -> Tuple[bool, str, float]:
+    """Validate image file. Returns (valid, error, size_mb) from a single stat."""
+    try:
+        st = path.stat()
+    except OSError:
+        return False, "File does not exist", 0.0
+    
+    if not stat.S_ISREG(st.st_mode):
+        return False, "Not a regular file", 0.0
     
     if path.suffix.lower() not in SUPPORTED_IMAGE_FORMATS:
-        return False, f"Unsupported format. Supported: {', '.join(SUPPORTED_IMAGE_FORMATS)}"
+        return False, f"Unsupported format. Supported: {', '.join(SUPPORTED_IMAGE_FORMATS)}", 0.0
     
-    size_mb = get_file_size_mb(path)
+    size_mb = st.st_size / (1024 * 1024)
     if size_mb > MAX_IMAGE_SIZE_MB:
-        return False, f"File too large ({size_mb:.1f}MB). Maximum: {MAX_IMAGE_SIZE_MB}MB"
+        return False, f"File too large ({size_mb:.1f}MB). Maximum: {MAX_IMAGE_SIZE_MB}MB", size_mb
     
-    return True, ""
+    return True, "", size_mb
 
 
-def copy_image_to_uploads(src_path: Path, dest_dir: Path, dest_filename: str) -> Path:
-    """Copy image to uploads directory with unique name."""
-    ensure_dir(dest_dir)
+def _copy_file_range(src_path: Path, dest_path: Path, size: int) -> bool:
+    """Copy with os.copy_file_range. Returns False if the kernel cannot do it."""
+    with open(src_path, 'rb', buffering=0) as fsrc, open(dest_path, 'wb', buffering=0) as fdst:
+        src_fd, dst_fd = fsrc.fileno(), fdst.fileno()
+        copied = 0
+        try:
+            while copied < size:
+                n = os.copy_file_range(src_fd, dst_fd, size - copied, copied, copied)
+                if n == 0:
+                    return False
+                copied += n
+        except OSError:
+            # e.g. cross-device copies on older kernels
+            return False
+    return True
+
+
+def fast_copy_file(src_path: Path, dest_path: Path) -> None:
+    """Copy file contents and timestamps.
+
+    shutil.copyfile already uses sendfile/fcopyfile; copy_file_range is only
+    tried first because it can reflink on copy-on-write filesystems.
+    """
+    st = os.stat(src_path)
+    if not (hasattr(os, 'copy_file_range') and _copy_file_range(src_path, dest_path, st.st_size)):
+        shutil.copyfile(src_path, dest_path)
+    # Only timestamps matter for uploads; skip copystat's mode/flags/xattr walk
+    os.utime(dest_path, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+
+def list_dir_names(path: Path) -> Set[str]:
+    """Names of all entries in a directory, read with a single scandir."""
+    with os.scandir(path) as it:
+        return {entry.name for entry in it}
+
+
+def reserve_upload_path(src_path: Path, dest_dir: Path, dest_filename: str,
+                        existing: Optional[Set[str]] = None) -> Path:
+    """Pick a free name in dest_dir for src_path without copying anything.
+
+    Pass the same ``existing`` set (from list_dir_names) for several images
+    going into one folder to avoid re-listing it; the chosen name is added to it.
+    """
     ext = src_path.suffix.lower()
-    target = dest_dir / f"{dest_filename}{ext}"
-    # Avoid overwriting by adding numeric suffix if needed
+    # Avoid overwriting by adding numeric suffix if needed; names are checked
+    # against one folder listing instead of a stat per candidate
+    if existing is None:
+        existing = list_dir_names(dest_dir)
+    name = f"{dest_filename}{ext}"
     counter = 2
-    while target.exists():
-        target = dest_dir / f"{dest_filename}-{counter}{ext}"
+    while name in existing:
+        name = f"{dest_filename}-{counter}{ext}"
         counter += 1
-    shutil.copy2(src_path, target)
+    existing.add(name)
+    return dest_dir / name
+
+
+def copy_image(src_path: Path, target: Path) -> Path:
+    """Copy an image to an already reserved target path."""
+    fast_copy_file(src_path, target)
     return target
 
 
+def copy_image_to_uploads(src_path: Path, dest_dir: Path, dest_filename: str) -> Path:
+    """Copy image to uploads directory with unique name."""
+    ensure_dir(dest_dir)
+    return copy_image(src_path, reserve_upload_path(src_path, dest_dir, dest_filename))
+
+
+def add_file_to_zip(zf: "zipfile.ZipFile", path: Path, arcname: str) -> None:
+    """Add a file to the ZIP, storing already-compressed images uncompressed."""
+    import zipfile
+    if path.suffix.lower() not in PRECOMPRESSED_IMAGE_FORMATS:
+        zf.write(path, arcname=arcname)
+        return
+    zinfo = zipfile.ZipInfo.from_file(path, arcname=arcname)
+    zinfo.compress_type = zipfile.ZIP_STORED
+    with open(path, 'rb') as src, zf.open(zinfo, 'w') as dest:
+        if zinfo.file_size > COPY_BUFSIZE:
+            # Large images: let the kernel page the file in instead of copying chunks
+            with mmap.mmap(src.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                dest.write(mapped)
+        else:
+            shutil.copyfileobj(src, dest, COPY_BUFSIZE)
+
+
 def yaml_escape(text: str) -> str:
     """Escape text for YAML frontmatter."""
     if text is None:
         return ""
-    s = str(text)
-    # Quote if contains special characters
-    if re.search(r'[":>#\[\],{}|]', s) or s.strip() != s or '\n' in s:
+    s = text if isinstance(text, str) else str(text)
+    # Fast path: plain ASCII words need no quoting
+    if s and s[0] != ' ' and s[-1] != ' ' and YAML_SAFE_CHARS.issuperset(s):
+        return s
+    # Quote if contains special characters or leading/trailing whitespace
+    # (checking the two end characters avoids a stripped copy of the string)
+    if s and (s[0].isspace() or s[-1].isspace() or not YAML_SPECIAL_CHARS.isdisjoint(s)):
         # escape quotes and backslashes
-        s = s.replace('\\', '\\\\').replace('"', '\\"')
+        if '\\' in s:
+            s = s.replace('\\', '\\\\')
+        if '"' in s:
+            s = s.replace('"', '\\"')
         return f'"{s}"'
     return s
 
 
+def render_frontmatter(title: str, date_str: str, slug: str, author: str = "",
+                       summary: str = "", image_url: str = "", image_alt: str = "",
+                       tags: Tuple[str, ...] = (), draft: bool = True,
+                       dt_iso: str = "") -> List[str]:
+    """Build the frontmatter lines, including both '---' fences.
+
+    Compatible with the site spec (date as YYYY-MM-DD). Optional fields are
+    only written when set; the caller appends the body and joins once.
+    """
+    fm_lines = [
+        "---",
+        f"title: {yaml_escape(title)}",
+        f"date: {date_str}",
+        f"slug: {yaml_escape(slug)}",
+    ]
+    if author:
+        fm_lines.append(f"author: {yaml_escape(author)}")
+    if summary:
+        # Trim to ~200 characters to align with site expectations
+        fm_lines.append(f"summary: {yaml_escape(summary[:200].rstrip())}")
+    if image_url:
+        fm_lines.append(f"image: {yaml_escape(image_url)}")
+    if image_alt:
+        fm_lines.append(f"imageAlt: {yaml_escape(image_alt)}")
+    if tags:
+        # YAML inline list: [tag1, tag2]
+        fm_lines.append(f"tags: [{', '.join(map(yaml_escape, tags))}]")
+    # Always write draft flag for safety
+    fm_lines.append(f"draft: {'true' if draft else 'false'}")
+    # Keep the full datetime for human reference; site ignores unknown fields
+    if dt_iso:
+        fm_lines.append(f"datetime: {yaml_escape(dt_iso)}")
+    fm_lines.append("---")
+    return fm_lines
+
+
 def sanitize_filename(filename: str) -> str:
     """Sanitize filename for safe file operations."""
-    # Remove path separators and other dangerous characters
-    filename = re.sub(r'[<>:"/\\|?*]', '_', filename)
-    # Remove control characters
-    filename = ''.join(ch for ch in filename if ord(ch) >= 32)
-    return filename[:255]  # Limit length
+    return filename.translate(FILENAME_TABLE)[:255]  # Limit length
 
 
 class SimpleNewsApp:
@@ -143,6 +357,8 @@ class SimpleNewsApp:
         
         # Auto-save timer
         self.auto_save_timer = None
+        self._last_draft_fields: Optional[Tuple[Any, ...]] = None
+        self._word_count_after_id: Optional[str] = None
         self.setup_auto_save()
         
         # Keyboard shortcuts
@@ -386,7 +602,7 @@ class SimpleNewsApp:
         self.body_text = tk.Text(body_frame, height=10, font=('Arial', 11), 
                                 wrap='word', relief='solid', borderwidth=1)
         self.body_text.pack(fill='both', expand=True)
-        self.body_text.bind('<KeyRelease>', self.update_word_counter)
+        self.body_text.bind('<KeyRelease>', self._on_body_change)
         
     def build_actions(self, parent):
         """Action buttons"""
@@ -442,15 +658,22 @@ class SimpleNewsApp:
         
     def update_summary_counter(self, event=None):
         """Update summary character counter"""
-        text = self.summary_text.get("1.0", tk.END).strip()
+        text = self.summary_text.get("1.0", "end-1c").strip()
         length = len(text)
         color = '#666' if length <= 200 else '#f44336'
         self.summary_counter.config(text=f"{length}/200", foreground=color)
         
+    def _on_body_change(self, event=None):
+        # Debounce: the whole body is only fetched and split once typing pauses
+        if self._word_count_after_id is not None:
+            self.master.after_cancel(self._word_count_after_id)
+        self._word_count_after_id = self.master.after(WORD_COUNT_DEBOUNCE_MS, self.update_word_counter)
+        
     def update_word_counter(self, event=None):
         """Update word counter for body text"""
-        text = self.body_text.get("1.0", tk.END).strip()
-        words = len(text.split()) if text else 0
+        self._word_count_after_id = None
+        # split() ignores surrounding whitespace, so no strip() copy is needed
+        words = len(self.body_text.get("1.0", "end-1c").split())
         self.word_counter.config(text=f"{words} words")
         
     def choose_image(self):
@@ -464,14 +687,13 @@ class SimpleNewsApp:
         )
         if path:
             image_path = Path(path)
-            valid, error = validate_image(image_path)
+            valid, error, size_mb = validate_image(image_path)
             
             if not valid:
                 messagebox.showwarning("Invalid Image", f"Cannot use this image:\n{error}")
                 return
                 
             self.hero_image_path = image_path
-            size_mb = get_file_size_mb(image_path)
             self.image_label.config(text=f"✅ {image_path.name} ({size_mb:.1f}MB)")
             self.update_status("Image selected")
             
@@ -498,7 +720,7 @@ class SimpleNewsApp:
             self.title_entry.focus()
             return
             
-        summary = self.summary_text.get("1.0", tk.END).strip()
+        summary = self.summary_text.get("1.0", "end-1c").strip()
         if not summary:
             messagebox.showwarning("Missing Summary", "Please enter a short summary.")
             self.summary_text.focus()
@@ -512,153 +734,205 @@ class SimpleNewsApp:
         self.is_creating = True
         self.create_btn.config(state='disabled', text='Creating...')
         self.progress_label.config(text="Preparing files...")
-        self.master.update()
         
-        try:
-            # Collect data
-            date_str = today_date_str()
-            dt_iso = now_iso_local()
-            author = self.var_author.get().strip()
-            slug = to_slug(title)
-            
-            if not slug:
-                raise ValueError("Could not generate valid slug from title")
-            
-            body = self.body_text.get("1.0", tk.END).strip()
-            
-            # Save author preference
-            if author:
-                self.settings['default_author'] = author
-                self.save_settings()
-            
-            year, month = date_str.split('-')[0], date_str.split('-')[1]
-            
-            # Prepare output dirs
-            self.progress_label.config(text="Creating directories...")
-            self.master.update()
-            
-            content_dir = OUTPUT_ROOT / "content" / "news"
-            uploads_dir = OUTPUT_ROOT / "static" / "uploads" / "news" / year / month
-            ensure_dir(content_dir)
-            ensure_dir(uploads_dir)
-            
-            # Track generated files
-            written_paths = []
-            
-            # Copy image if selected
-            image_url = ""
-            if self.hero_image_path:
-                self.progress_label.config(text="Processing image...")
-                self.master.update()
-                
-                hero_base = f"{date_str}-{slug}-hero"
-                hero_base = sanitize_filename(hero_base)
-                copied = copy_image_to_uploads(self.hero_image_path, uploads_dir, hero_base)
-                image_url = "/" + "/".join(copied.relative_to(OUTPUT_ROOT).parts)
-                image_url = image_url.replace("\\", "/")
-                written_paths.append(copied)
-                
-            # Build frontmatter
-            self.progress_label.config(text="Creating content...")
-            self.master.update()
-            
-            fm_lines = [
-                "---",
-                f"title: {yaml_escape(title)}",
-                f"date: {date_str}",
-                f"slug: {yaml_escape(slug)}",
-            ]
-            
-            if author:
-                fm_lines.append(f"author: {yaml_escape(author)}")
-                
-            if summary:
-                # Limit to 200 chars
-                short = summary[:200].rstrip()
-                fm_lines.append(f"summary: {yaml_escape(short)}")
-                
-            if image_url:
-                fm_lines.append(f"image: {yaml_escape(image_url)}")
-                fm_lines.append(f"imageAlt: {yaml_escape(title)}")
-                
-            # Always mark as draft for safety
-            fm_lines.append("draft: true")
-            fm_lines.append(f"datetime: {yaml_escape(dt_iso)}")
-            fm_lines.append("---")
-            
-            # Markdown content
-            if not body:
-                body = summary  # Use summary as body if no full article
+        # Collect data on the UI thread; the worker only sees plain values
+        params = {
+            'title': title,
+            'summary': summary,
+            'date_str': today_date_str(),
+            'dt_iso': now_iso_local(),
+            'author': self.var_author.get().strip(),
+            'slug': to_slug(title),
+            'body': self.body_text.get("1.0", "end-1c").strip(),
+            'hero_image_path': self.hero_image_path,
+        }
+        if not params['slug']:
+            self._on_zip_failed(ValueError("Could not generate valid slug from title"))
+            return
+        
+        # Save author preference (only when it changed)
+        author = params['author']
+        if author and author != self.settings.get('default_author'):
+            self.settings['default_author'] = author
+            self.save_settings()
+        
+        # Remember which draft this ZIP came from; autosave may store a new one meanwhile
+        draft_fields = tuple(self._draft_data().values())
+        saved_fields = self._last_draft_fields
+        self._run_in_background(lambda report: self._write_news_zip(params, report),
+                                lambda zip_path: self._on_zip_created(zip_path, draft_fields, saved_fields),
+                                self._on_zip_failed)
+        
+    def _run_in_background(self, work, on_done, on_error):
+        """Run work(report) on a worker thread; callbacks run on the Tk thread.
+        
+        The worker must not touch Tk widgets. It posts progress text through
+        report(), which is drained into the progress label every 50 ms.
+        """
+        events: "queue.Queue[Tuple[str, Any]]" = queue.Queue()
+        
+        def target():
+            try:
+                result = work(lambda text: events.put(('progress', text)))
+            except Exception as e:
+                traceback.print_exc()
+                events.put(('error', e))
+            else:
+                events.put(('done', result))
                 
-            content = "\n".join(fm_lines) + "\n\n" + body + "\n"
-            
-            # Write markdown file
-            filename = sanitize_filename(f"{date_str}-{slug}.md")
-            md_path = content_dir / filename
-            md_path.write_text(content, encoding='utf-8')
-            written_paths.append(md_path)
-            
-            # Create ZIP
-            self.progress_label.config(text="Creating ZIP file...")
-            self.master.update()
-            
-            zip_name = f"news-{date_str}-{slug}.zip"
-            zip_name = sanitize_filename(zip_name)
-            zip_path = OUTPUT_ROOT / zip_name
-            
-            with zipfile.ZipFile(zip_path, 'w', compression=zipfile.ZIP_DEFLATED) as zf:
-                for path in written_paths:
-                    if path.is_file():
-                        rel_path = path.relative_to(OUTPUT_ROOT)
-                        zf.write(path, arcname=str(rel_path))
-                        
-            self.last_zip_path = zip_path
-            
-            # Clear progress and show success
+        threading.Thread(target=target, daemon=True).start()
+        self.master.after(50, self._drain_events, events, on_done, on_error)
+        
+    def _drain_events(self, events, on_done, on_error):
+        while True:
+            try:
+                kind, payload = events.get_nowait()
+            except queue.Empty:
+                break
+            if kind == 'progress':
+                self.progress_label.config(text=payload)
+                continue
             self.progress_label.config(text="")
-            self.update_status(f"✅ ZIP created: {zip_name}")
+            if kind == 'done':
+                on_done(payload)
+            else:
+                on_error(payload)
+            return
+        self.master.after(50, self._drain_events, events, on_done, on_error)
+        
+    def _write_news_zip(self, params: Dict[str, Any], report) -> Path:
+        """Copy the image, write the markdown and pack the ZIP. Runs on a worker thread."""
+        title = params['title']
+        summary = params['summary']
+        date_str = params['date_str']
+        slug = params['slug']
+        body = params['body']
+        hero_image_path = params['hero_image_path']
+        
+        year, month = date_str[:4], date_str[5:7]
+        
+        # Prepare output dirs
+        report("Creating directories...")
+        
+        # Relative forms double as ZIP entry names and web paths, so no relative_to() later
+        content_rel = "content/news"
+        uploads_rel = f"static/uploads/news/{year}/{month}"
+        content_dir = OUTPUT_ROOT / content_rel
+        uploads_dir = OUTPUT_ROOT / uploads_rel
+        ensure_dir(content_dir)
+        ensure_dir(uploads_dir)
+        
+        # Track generated files as (path, archive name) pairs
+        written_paths = []
+        
+        # Copy image if selected
+        image_url = ""
+        if hero_image_path:
+            report("Processing image...")
             
-            # Clear draft file since we successfully created the news
-            draft_file = OUTPUT_ROOT / "draft.json"
-            if draft_file.exists():
-                try:
-                    draft_file.unlink()
-                except:
-                    pass
+            hero_base = f"{date_str}-{slug}-hero"
+            hero_base = sanitize_filename(hero_base)
+            copied = copy_image_to_uploads(hero_image_path, uploads_dir, hero_base)
+            image_url = f"/{uploads_rel}/{copied.name}"
+            written_paths.append((copied, image_url[1:]))
             
-            result = messagebox.askyesno(
-                "Success! 🎉",
-                f"News ZIP created successfully!\n\n"
-                f"File: {zip_name}\n\n"
-                f"Would you like to open the output folder now?\n\n"
-                f"Upload this ZIP file to your news website to publish."
-            )
+        # Build frontmatter
+        report("Creating content...")
+        
+        fm_lines = render_frontmatter(
+            title, date_str, slug, author=params['author'], summary=summary,
+            image_url=image_url, image_alt=title if image_url else "",
+            draft=True,  # Always mark as draft for safety
+            dt_iso=params['dt_iso'],
+        )
+        
+        # Markdown content
+        if not body:
+            body = summary  # Use summary as body if no full article
             
-            if result:
-                self.open_output_folder()
-                
-        except Exception as e:
-            self.progress_label.config(text="")
-            error_msg = f"Failed to create news ZIP:\n{str(e)}"
-            if sys.platform == 'win32' and 'Permission denied' in str(e):
-                error_msg += "\n\nTip: Close any programs that might be using the output folder."
-            messagebox.showerror("Error", error_msg)
-            traceback.print_exc()
+        # Blank line, body and trailing newline go through the same single join
+        fm_lines.extend(("", body, ""))
+        content = "\n".join(fm_lines)
+        
+        # Write markdown file (the loose copy stays documented output)
+        filename = sanitize_filename(f"{date_str}-{slug}.md")
+        md_path = content_dir / filename
+        md_data = content.encode('utf-8')
+        write_file_bytes(md_path, md_data)
+        
+        # Create ZIP
+        report("Creating ZIP file...")
+        
+        zip_name = f"news-{date_str}-{slug}.zip"
+        zip_name = sanitize_filename(zip_name)
+        zip_path = OUTPUT_ROOT / zip_name
+        
+        import zipfile
+        with zipfile.ZipFile(zip_path, 'w', compression=zipfile.ZIP_DEFLATED, compresslevel=1) as zf:
+            for path, arcname in written_paths:
+                if path.is_file():
+                    add_file_to_zip(zf, path, arcname)
+            # The markdown is still in memory, so it goes in without re-reading md_path
+            zinfo = zipfile.ZipInfo(f"{content_rel}/{filename}", date_time=time.localtime()[:6])
+            zinfo.compress_type = zipfile.ZIP_DEFLATED
+            zinfo.external_attr = (stat.S_IFREG | 0o644) << 16
+            zf.writestr(zinfo, md_data, compresslevel=1)
+        return zip_path
+        
+    def _finish_creating(self):
+        self.is_creating = False
+        self.create_btn.config(state='normal', text='🎯 Create News ZIP')
+        
+    def _on_zip_created(self, zip_path: Path, draft_fields: Tuple[Any, ...],
+                        saved_fields: Optional[Tuple[Any, ...]]):
+        self.last_zip_path = zip_path
+        self._finish_creating()
+        
+        # Show success
+        self.update_status(f"✅ ZIP created: {zip_path.name}")
+        
+        # Clear draft file since we successfully created the news, unless
+        # a different article was saved to it while the ZIP was being built
+        draft_file = OUTPUT_ROOT / "draft.json"
+        if self._last_draft_fields in (saved_fields, draft_fields) and draft_file.exists():
+            try:
+                draft_file.unlink()
+            except:
+                pass
+        
+        result = messagebox.askyesno(
+            "Success! 🎉",
+            f"News ZIP created successfully!\n\n"
+            f"File: {zip_path.name}\n\n"
+            f"Would you like to open the output folder now?\n\n"
+            f"Upload this ZIP file to your news website to publish."
+        )
+        
+        if result:
+            self.open_output_folder()
             
-        finally:
-            self.is_creating = False
-            self.create_btn.config(state='normal', text='🎯 Create News ZIP')
+    def _on_zip_failed(self, error: Exception):
+        self.progress_label.config(text="")
+        self._finish_creating()
+        error_msg = f"Failed to create news ZIP:\n{str(error)}"
+        if sys.platform == 'win32' and 'Permission denied' in str(error):
+            error_msg += "\n\nTip: Close any programs that might be using the output folder."
+        messagebox.showerror("Error", error_msg)
             
     def open_output_folder(self):
         """Open the output folder"""
         ensure_dir(OUTPUT_ROOT)
         try:
+            # Launch without waiting: xdg-open can block until the file manager
+            # exits, which would freeze the Tk event loop
             if sys.platform == 'win32':
                 os.startfile(str(OUTPUT_ROOT))
-            elif sys.platform == 'darwin':
-                subprocess.run(['open', str(OUTPUT_ROOT)], check=False)
             else:
-                subprocess.run(['xdg-open', str(OUTPUT_ROOT)], check=False)
+                import subprocess
+                opener = 'open' if sys.platform == 'darwin' else 'xdg-open'
+                proc = subprocess.Popen([opener, str(OUTPUT_ROOT)], start_new_session=True)
+                # Reap it off the UI thread so it doesn't linger as a zombie
+                threading.Thread(target=proc.wait, daemon=True).start()
         except Exception as e:
             messagebox.showinfo("Output Folder", f"Your files are in:\n{OUTPUT_ROOT}")
             
@@ -724,8 +998,9 @@ Tips:
         
     def update_status(self, message):
         """Update status bar"""
+        # The label redraws on the next idle pass; a full update() here would
+        # also dispatch pending user events from inside the caller's handler
         self.status_label.config(text=message)
-        self.master.update()
         
     def center_window(self):
         """Center window on screen"""
@@ -739,8 +1014,8 @@ Tips:
     def has_unsaved_changes(self):
         """Check if there are unsaved changes"""
         return (self.var_title.get().strip() or 
-                self.summary_text.get("1.0", tk.END).strip() or
-                self.body_text.get("1.0", tk.END).strip() or
+                text_has_content(self.summary_text) or
+                text_has_content(self.body_text) or
                 self.hero_image_path is not None)
                 
     def setup_auto_save(self):
@@ -752,23 +1027,33 @@ Tips:
             
         self.auto_save_timer = self.master.after(30000, auto_save)
         
+    def _draft_data(self) -> Dict[str, Any]:
+        """Form fields as stored in draft.json"""
+        return {
+            'title': self.var_title.get(),
+            'summary': self.summary_text.get("1.0", "end-1c").strip(),
+            'author': self.var_author.get(),
+            'body': self.body_text.get("1.0", "end-1c").strip(),
+            'image': str(self.hero_image_path) if self.hero_image_path else None,
+        }
+        
     def save_draft(self, silent=False):
         """Save current form as draft"""
         draft_file = OUTPUT_ROOT / "draft.json"
         ensure_dir(OUTPUT_ROOT)
         
-        draft_data = {
-            'title': self.var_title.get(),
-            'summary': self.summary_text.get("1.0", tk.END).strip(),
-            'author': self.var_author.get(),
-            'body': self.body_text.get("1.0", tk.END).strip(),
-            'image': str(self.hero_image_path) if self.hero_image_path else None,
-            'saved_at': now_iso_local()
-        }
+        draft_data = self._draft_data()
+        
+        # Auto-save skips the write when nothing changed since the last save
+        fields = tuple(draft_data.values())
+        if silent and fields == self._last_draft_fields and draft_file.exists():
+            return
+        draft_data['saved_at'] = now_iso_local()
         
         try:
-            with open(draft_file, 'w', encoding='utf-8') as f:
-                json.dump(draft_data, f, indent=2, ensure_ascii=False)
+            data = json.dumps(draft_data, ensure_ascii=False, separators=(',', ':'))
+            write_file_bytes(draft_file, data.encode('utf-8'))
+            self._last_draft_fields = fields
             if not silent:
                 self.update_status("✅ Draft saved")
         except Exception as e:
@@ -780,8 +1065,7 @@ Tips:
         draft_file = OUTPUT_ROOT / "draft.json"
         if draft_file.exists():
             try:
-                with open(draft_file, 'r', encoding='utf-8') as f:
-                    draft_data = json.load(f)
+                draft_data = json.loads(draft_file.read_bytes())
                     
                 if messagebox.askyesno("Restore Draft", 
                                        "Found a saved draft. Would you like to restore it?"):
@@ -834,8 +1118,7 @@ Tips:
         self.image_label.config(text="No image selected")
         
         try:
-            with open(draft_file, 'r', encoding='utf-8') as f:
-                draft_data = json.load(f)
+            draft_data = json.loads(draft_file.read_bytes())
                 
             self.var_title.set(draft_data.get('title', ''))
             
@@ -870,8 +1153,7 @@ Tips:
         """Load saved settings"""
         if SETTINGS_FILE.exists():
             try:
-                with open(SETTINGS_FILE, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+                return json.loads(SETTINGS_FILE.read_bytes())
             except Exception:
                 pass
         return {}
@@ -879,8 +1161,9 @@ Tips:
     def save_settings(self):
         """Save settings"""
         try:
-            with open(SETTINGS_FILE, 'w', encoding='utf-8') as f:
-                json.dump(self.settings, f, indent=2, ensure_ascii=False)
+            # json.dumps encodes in one C call; json.dump streams many small writes
+            data = json.dumps(self.settings, ensure_ascii=False, separators=(',', ':'))
+            write_file_bytes(SETTINGS_FILE, data.encode('utf-8'))
         except Exception:
             pass
 
@@ -894,6 +1177,10 @@ def main():
     
     # Handle window close
     def on_closing():
+        # The ZIP is written on a daemon thread; closing now would truncate it
+        if app.is_creating:
+            messagebox.showwarning("Please wait", "The news ZIP is still being created. Close the window when it finishes.")
+            return
         if app.has_unsaved_changes():
             result = messagebox.askyesnocancel("Save Draft", 
                                                "Would you like to save your work as a draft?")
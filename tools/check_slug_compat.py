@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""Check that the generators' to_slug matches the original implementation.
+
+Slugs end up in published file names and URLs, so the table-based to_slug
+must produce exactly what the original NFD + category 'Mn' filter did.
+Every code point is tried on its own, between two letters, and followed
+by a combining acute accent.
+"""
+import re
+import sys
+import unicodedata
+from pathlib import Path
+
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / 'generator'))
+
+import news_generator  # noqa: E402
+import news_generator_simple  # noqa: E402
+
+
+def reference_slug(value: str) -> str:
+    """to_slug as originally written; the behaviour to preserve."""
+    text = str(value or "").strip().lower()
+    text = unicodedata.normalize('NFD', text)
+    text = ''.join(ch for ch in text if unicodedata.category(ch) != 'Mn')
+    text = re.sub(r"[^a-z0-9]+", "-", text)
+    text = re.sub(r"(^-|-$)", "", text)
+    return text
+
+
+def main() -> int:
+    problems: list[str] = []
+    for codepoint in range(sys.maxunicode + 1):
+        if 0xD800 <= codepoint <= 0xDFFF:
+            continue
+        ch = chr(codepoint)
+        for sample in (ch, f"a{ch}b", f"a{ch}́b"):
+            expected = reference_slug(sample)
+            for module in (news_generator, news_generator_simple):
+                got = module.to_slug(sample)
+                if got != expected:
+                    problems.append(f"{module.__name__}: U+{codepoint:04X} {sample!r} -> {got!r}, expected {expected!r}")
+
+    if not problems:
+        print('[slug] ✔ to_slug matches the original for every code point')
+        return 0
+    print(f"[slug] ✖ {len(problems)} mismatches")
+    for p in problems[:20]:
+        print(f"  - {p}")
+    return 1
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -17,6 +17,11 @@ UPLOADS_ROOT = ROOT / 'static' / 'uploads' / 'news'
 
 MD_EXT_RE = re.compile(r"\.md$", re.IGNORECASE)
 DATE_RE = re.compile(r"^(\d{4})-(\d{2})-(\d{2})-(?:[a-z0-9]+(?:-[a-z0-9]+)*)\.md$")
+WHITESPACE_RE = re.compile(r"\s+")
+UPLOADS_PREFIX_RE = re.compile(r"(?:/static/uploads/news/)+")
+FRONTMATTER_IMAGE_RE = re.compile(r"^(image:\s*)([^\n]+)$", re.MULTILINE)
+MARKDOWN_IMAGE_RE = re.compile(r"!\[([^\]]*)\]\(([^)]+)\)")
+EXTERNAL_URL_RE = re.compile(r"^(?:https?:|blob:|data:)")
 
 
 def info(msg: str):
@@ -37,14 +42,14 @@ def fix_paths_in_text(text: str) -> str:
     def normalize_hero_path(raw: str) -> str:
         val = (raw or '').strip().strip('"\'')
         # Collapse accidental double prefixes and internal whitespace
-        val = re.sub(r"\s+", " ", val)
+        val = WHITESPACE_RE.sub(" ", val)
         # If it already contains the uploads root, reduce duplicates and remove spaces
         if '/static/uploads/news/' in val:
             # Remove any accidental spaces around the slash and collapse duplicate segments
             val = val.replace(' /static/uploads/news/', '/static/uploads/news/')
             val = val.replace('/static/uploads/news/ ', '/static/uploads/news/')
             # If duplicated twice, reduce to one occurrence
-            val = re.sub(r"(?:/static/uploads/news/)+", "/static/uploads/news/", val)
+            val = UPLOADS_PREFIX_RE.sub("/static/uploads/news/", val)
             # Ensure it starts with a slash
             if not val.startswith('/'):
                 val = '/' + val
@@ -60,25 +65,25 @@ def fix_paths_in_text(text: str) -> str:
         normalized = normalize_hero_path(value)
         return f"{prefix}\"{normalized}\""
 
-    text = re.sub(r"^(image:\s*)([^\n]+)$", repl_frontmatter, text, flags=re.MULTILINE)
+    text = FRONTMATTER_IMAGE_RE.sub(repl_frontmatter, text)
 
     # Inline markdown images
     def repl_markdown(m):
         alt = m.group(1)
         path = (m.group(2) or '').strip()
         # Leave external or blob/data URLs as-is
-        if re.match(r"^(?:https?:|blob:|data:)", path):
+        if EXTERNAL_URL_RE.match(path):
             return m.group(0)
         # Already absolute under uploads
         if path.startswith('/static/uploads/news/'):
             # Normalize duplicate segments just in case
-            fixed = re.sub(r"(?:/static/uploads/news/)+", "/static/uploads/news/", path)
+            fixed = UPLOADS_PREFIX_RE.sub("/static/uploads/news/", path)
             return f"![{alt}]({fixed})"
         # Rewrite relative to uploads root
         fixed = f"/static/uploads/news/{path.lstrip('/')}"
         return f"![{alt}]({fixed})"
 
-    text = re.sub(r"!\[([^\]]*)\]\(([^)]+)\)", repl_markdown, text)
+    text = MARKDOWN_IMAGE_RE.sub(repl_markdown, text)
     return text
 
 